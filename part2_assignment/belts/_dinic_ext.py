@@ -0,0 +1,34 @@
+"""Ahead-of-time build of the Dinic max-flow kernel in belts/_dinic_kernels.py.
+
+Run from part2_assignment/:
+
+    python -m belts._dinic_ext
+
+This writes a dinic_native extension next to main.py. main.py imports it
+when present, which skips both the numba import and the JIT compile at
+start-up, and otherwise falls back to the numba (or pure-Python) kernels.
+"""
+import os
+
+from numba.pycc import CC
+
+from .main import _load_kernels
+
+_max_flow_csr = _load_kernels()._max_flow_csr
+
+cc = CC('dinic_native')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export('dinic_maxflow', 'f8(i4[:], i4[:], f8[:], i4[:], i8, i8, f8, i4[:], i4[:], i4[:], i4[:])')
+def dinic_maxflow(start, to, cap, rev, s, t, eps, level, q, it, path):
+    return _max_flow_csr(start, to, cap, rev, s, t, eps, level, q, it, path)
+
+
+@cc.export('dinic_maxflow_i8', 'i8(i4[:], i4[:], i8[:], i4[:], i8, i8, i8, i4[:], i4[:], i4[:], i4[:])')
+def dinic_maxflow_i8(start, to, cap, rev, s, t, eps, level, q, it, path):
+    return _max_flow_csr(start, to, cap, rev, s, t, eps, level, q, it, path)
+
+
+if __name__ == '__main__':
+    cc.compile()
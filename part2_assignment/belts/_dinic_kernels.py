@@ -0,0 +1,89 @@
+# Dinic max-flow kernels used by belts/main.py.
+#
+# main.py imports this file as the top-level module _dinic_kernels whether it
+# runs as a script or is imported as belts.main: numba's on-disk cache records
+# the defining module by name, so the name must be the same in both cases.
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional: without it the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+# --------------------- CSR kernels ---------------------
+# The graph is stored in CSR form: the edges leaving u are start[u]:start[u+1],
+# to[e] is the head node, cap[e] the residual capacity and rev[e] the paired
+# reverse edge, so the tail of e is to[rev[e]]. Residual capacity counts only
+# when it exceeds eps. cap is int64 (with eps == 0) for integer inputs and
+# float64 otherwise; numba compiles one specialisation per type.
+
+@njit(cache=True, boundscheck=False)
+def _bfs_csr(start, to, cap, s, t, eps, level, q):
+    level[:] = -1
+    qh = 0; qt = 1
+    q[0] = s; level[s] = 0
+    while qh < qt:
+        u = q[qh]; qh += 1
+        for e in range(start[u], start[u + 1]):
+            v = to[e]
+            if cap[e] > eps and level[v] < 0:
+                level[v] = level[u] + 1
+                q[qt] = v; qt += 1
+    return level[t] >= 0
+
+@njit(cache=True, boundscheck=False, inline='always')
+def _find_first(to, cap, level, lo, hi, want, eps):
+    # first edge in lo:hi with residual capacity into level `want`, else hi;
+    # the test uses & rather than `and` so the loop body has no extra branch
+    for e in range(lo, hi):
+        if (cap[e] > eps) & (level[to[e]] == want):
+            return e
+    return hi
+
+@njit(cache=True, boundscheck=False)
+def _dfs_csr(start, to, cap, rev, s, t, eps, level, it, path, flow):
+    # one blocking-flow phase, iteratively: path holds the edges taken from s,
+    # it[u] the current edge of u. After an augmentation the search resumes at
+    # the tail of the first saturated edge instead of restarting from s.
+    depth = 0
+    u = s
+    while True:
+        if u == t:
+            f = cap[path[0]]
+            for k in range(1, depth):
+                if cap[path[k]] < f: f = cap[path[k]]
+            for k in range(depth):
+                e = path[k]
+                cap[e] -= f
+                cap[rev[e]] += f
+            flow += f
+            depth = 0
+            while cap[path[depth]] > eps:
+                depth += 1
+            u = to[rev[path[depth]]]
+            continue
+        end = start[u + 1]
+        e = _find_first(to, cap, level, it[u], end, level[u] + 1, eps)
+        it[u] = e
+        if e < end:
+            path[depth] = e; depth += 1
+            u = to[e]
+        else:
+            # dead end: retreat to the tail of the last edge and skip it
+            if depth == 0: return flow
+            depth -= 1
+            u = to[rev[path[depth]]]
+            it[u] += 1
+
+@njit(cache=True, boundscheck=False)
+def _max_flow_csr(start, to, cap, rev, s, t, eps, level, q, it, path):
+    flow = eps * 0  # zero of the capacity type: int64 or float64
+    while _bfs_csr(start, to, cap, s, t, eps, level, q):
+        it[:] = start[:-1]
+        flow = _dfs_csr(start, to, cap, rev, s, t, eps, level, it, path, flow)
+    return flow
@@ -1,86 +1,150 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 import json
-from collections import deque, defaultdict
+import importlib.util
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+import numpy as np
+
+# _dumps returns bytes, written straight to stdout's buffer: orjson emits
+# UTF-8 whatever the console encoding, and the json fallback stays ASCII.
+try:
+    import orjson
+
+    def _loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (e.g. NaN / Infinity); keep accepting
+            # what json.load did
+            return json.loads(data)
+
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    _dumps = lambda obj: json.dumps(obj, separators=(',',':')).encode()
+
+
+def _load_kernels():
+    # Load belts/_dinic_kernels.py by file path and register it in sys.modules
+    # as the top-level module _dinic_kernels: numba's on-disk cache resolves
+    # the kernels' module by that name (see _dinic_kernels.py), whether main.py
+    # runs as a script or is imported as belts.main. belts/ itself is not put
+    # on sys.path. _dinic_ext.py loads the kernels through here as well.
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_dinic_kernels.py')
+    mod = sys.modules.get('_dinic_kernels')
+    if mod is None:
+        spec = importlib.util.spec_from_file_location('_dinic_kernels', path)
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules['_dinic_kernels'] = mod
+        spec.loader.exec_module(mod)
+    elif os.path.abspath(getattr(mod, '__file__', None) or '') != path:
+        raise ImportError('another _dinic_kernels module is already imported from %r' % mod.__file__)
+    return mod
+
+try:
+    # ahead-of-time build of the Dinic kernel, see belts/_dinic_ext.py; with it
+    # numba is not imported at all
+    if __package__:
+        from .dinic_native import dinic_maxflow as _max_flow_f8, dinic_maxflow_i8 as _max_flow_i8
+    else:
+        from dinic_native import dinic_maxflow as _max_flow_f8, dinic_maxflow_i8 as _max_flow_i8
+except ImportError:
+    _max_flow_f8 = _max_flow_i8 = _load_kernels()._max_flow_csr
 
 EPS = 1e-9
 
 # --------------------- Deterministic Dinic ---------------------
-class Edge:
-    __slots__ = ('to','rev','cap','orig')
-    def __init__(self, to, rev, cap):
-        self.to = to
-        self.rev = rev
-        self.cap = float(cap)
-        self.orig = float(cap)
-
 class Dinic:
-    def __init__(self, n):
+    def __init__(self, n, max_edges, integral=False):
+        # integral: capacities are whole numbers, so flow runs exactly in int64
+        # and an edge is saturated at 0 rather than at EPS
         self.n = n
-        self.g = [[] for _ in range(n)]
+        self.m = 0
+        dtype = np.int64 if integral else np.float64
+        self.eps = 0 if integral else EPS
+        self._max_flow = _max_flow_i8 if integral else _max_flow_f8
+        self.to = np.empty(max_edges, np.int32)
+        self.cap = np.empty(max_edges, dtype)
+        self.orig = np.empty(max_edges, dtype)
+        # scratch arrays reused by every max_flow call: BFS levels and queue,
+        # current-edge pointers and the augmenting path
+        self.level = np.empty(n, np.int32)
+        self.q = np.empty(n, np.int32)
+        self.it = np.empty(n, np.int32)
+        self.path = np.empty(n, np.int32)
     def add_edge(self, u, v, c):
-        # deterministic insertion order
-        ulist = self.g[u]
-        vlist = self.g[v]
-        ulist.append(Edge(v, len(vlist), c))
-        vlist.append(Edge(u, len(ulist)-1, 0.0))
-        # return reference to forward edge for bookkeeping
-        return u, len(ulist)-1
-    def bfs(self, s, t, level):
-        for i in range(len(level)): level[i] = -1
-        q = deque([s]); level[s] = 0
-        while q:
-            u = q.popleft()
-            for e in self.g[u]:
-                if e.cap > EPS and level[e.to] < 0:
-                    level[e.to] = level[u] + 1
-                    q.append(e.to)
-        return level[t] >= 0
-    def dfs(self, u, t, f, level, it):
-        if u == t: return f
-        for i in range(it[u], len(self.g[u])):
-            it[u] = i
-            e = self.g[u][i]
-            if e.cap > EPS and level[e.to] == level[u] + 1:
-                pushed = self.dfs(e.to, t, min(f, e.cap), level, it)
-                if pushed > EPS:
-                    e.cap -= pushed
-                    self.g[e.to][e.rev].cap += pushed
-                    return pushed
-        return 0.0
+        # forward and reverse edge go into consecutive slots; build_csr
+        # recovers the tail of edge e as to[e ^ 1]
+        e = self.m
+        self.m = e + 2
+        self.to[e] = v; self.cap[e] = c; self.orig[e] = c
+        self.to[e + 1] = u; self.cap[e + 1] = 0; self.orig[e + 1] = 0
+        # return index of forward edge for bookkeeping
+        return e
+    def build_csr(self):
+        # Lay the edges out in CSR order: the edges leaving u occupy
+        # start[u]:start[u+1], in insertion order (stable sort by tail).
+        # Edge e as returned by add_edge is afterwards found at pos[e].
+        m = self.m
+        tails = self.to[np.arange(m) ^ 1]
+        order = np.argsort(tails, kind='stable')
+        self.pos = pos = np.empty(m, np.int32)
+        pos[order] = np.arange(m, dtype=np.int32)
+        self.start = np.zeros(self.n + 1, np.int32)
+        np.cumsum(np.bincount(tails, minlength=self.n), out=self.start[1:])
+        self.to = self.to[order]
+        self.cap = self.cap[order]
+        self.orig = self.orig[order]
+        self.rev = pos[order ^ 1]
     def max_flow(self, s, t):
-        flow = 0.0
-        level = [-1] * self.n
-        while self.bfs(s, t, level):
-            it = [0] * self.n
-            while True:
-                pushed = self.dfs(s, t, 1e18, level, it)
-                if pushed <= EPS: break
-                flow += pushed
-        return flow
+        # on return self.level holds the final, failed BFS: level >= 0 is
+        # exactly the set of nodes reachable from s in the residual graph
+        return self._max_flow(self.start, self.to, self.cap, self.rev, s, t, self.eps,
+                              self.level, self.q, self.it, self.path)
 
 # --------------------- Utilities ---------------------
 class NameMap:
     def __init__(self):
         self.map = {}
-        self.list = []
+        self._names_cache = None
     def id(self, name):
-        if name not in self.map:
-            self.map[name] = len(self.list)
-            self.list.append(name)
-        return self.map[name]
+        i = self.map.get(name)
+        if i is None:
+            i = len(self.map)
+            self.map[name] = i
+            self._names_cache = None
+        return i
     def name(self, idx):
-        return self.list[idx]
+        # dicts keep insertion order, so the id -> name table is just the keys
+        if self._names_cache is None:
+            self._names_cache = tuple(self.map)
+        return self._names_cache[idx]
 
 # --------------------- Main solver ---------------------
 
 def read_input():
-    return json.load(sys.stdin)
+    return _loads(sys.stdin.buffer.read())
 
 
 def write_output(obj):
-    json.dump(obj, sys.stdout, separators=(',',':'))
+    sys.stdout.buffer.write(_dumps(obj))
+
+
+def _is_integral(edges_in, sources, node_caps):
+    # belt rates are normally whole numbers per minute. The int64 path is only
+    # exact while every rate, and so every sum of them, stays below 2**53: the
+    # rates pass through float64 on the way in, and larger inputs could round
+    # there or overflow int64, so they take the float64 path instead.
+    rates = [e.get('lo', 0) for e in edges_in]
+    rates += [e.get('hi', 0) for e in edges_in]
+    rates += sources.values()
+    rates += node_caps.values()
+    return all(isinstance(v, int) for v in rates) and sum(abs(v) for v in rates) < 2**53
 
 
 def solve_belts(inp):
@@ -89,15 +153,24 @@ def solve_belts(inp):
     sink = inp.get('sink')
     node_caps = inp.get('node_caps', {})
 
-    # collect all node names deterministically
-    nodes = set()
-    for e in edges_in:
-        nodes.add(e['from']); nodes.add(e['to'])
-    nodes |= set(sources.keys())
+    # With integer inputs every capacity, demand and flow is a whole number and
+    # Dinic runs exactly in int64: saturation is cap == 0 and the feasibility
+    # checks compare for equality. Otherwise fall back to float64 with EPS.
+    integral = _is_integral(edges_in, sources, node_caps)
+    eps, tol = (0, 0) if integral else (EPS, 1e-6)
+
+    # sort edges once; itemgetter keeps the key extraction in C
+    edges_sorted = sorted(edges_in, key=itemgetter('from', 'to'))
+
+    # collect all node names deterministically (dict as an ordered set)
+    nodes = {}
+    for e in edges_sorted:
+        nodes[e['from']] = None; nodes[e['to']] = None
+    nodes.update(dict.fromkeys(sources))
     if sink is not None:
-        nodes.add(sink)
-    nodes |= set(node_caps.keys())
-    sorted_nodes = sorted(list(nodes))
+        nodes[sink] = None
+    nodes.update(dict.fromkeys(node_caps))
+    sorted_nodes = sorted(nodes)
 
     nm = NameMap()
     for name in sorted_nodes:
@@ -106,186 +179,181 @@ def solve_belts(inp):
     # We'll perform node-splitting for nodes that have capacity constraints.
     # For determinism we create indices as follows: for each original node in sorted order,
     # we assign an "in" index then an "out" index (if splitting), or single index if no split.
+    # in_id / out_id are indexed by the NameMap id of the node.
+    n_nodes = len(sorted_nodes)
+    # split nodes are the capped ones (note: spec said not for source or sink)
+    n_split = sum(1 for name in node_caps if name != sink and name not in sources)
+
+    # super nodes come after the node indices: s* and t* and later main S and T
+    S_star = n_nodes + n_split
+    T_star = S_star + 1
+    S_main = S_star + 2
+    T_main = S_star + 3
 
-    in_id = {}
-    out_id = {}
+    N = S_star + 4
+    # every edge is known up front: split edges, belts, at most one S*/T* edge
+    # per node index, one edge per source and the sink edge (each with its reverse)
+    max_edges = 2 * (n_split + len(edges_in) + (N - 4) + len(sources) + 1)
+    dinic = Dinic(N, max_edges, integral)
+
+    # Step 1: assign indices and add node-split cap edges in the same pass
+    in_id = np.empty(n_nodes, np.int32)
+    out_id = np.empty(n_nodes, np.int32)
+    node_split_edge_ref = {}  # name -> edge_idx
     idx = 0
-    for name in sorted_nodes:
+    for i, name in enumerate(sorted_nodes):
         if name in node_caps and name != sink and name not in sources:
-            # split node (note: spec said not for source or sink)
-            in_id[name] = idx; idx += 1
-            out_id[name] = idx; idx += 1
+            in_id[i] = idx
+            out_id[i] = idx + 1
+            node_split_edge_ref[name] = dinic.add_edge(idx, idx + 1, float(node_caps[name]))
+            idx += 2
         else:
             # single node: use one id for both in/out
-            in_id[name] = idx
-            out_id[name] = idx
+            in_id[i] = idx
+            out_id[i] = idx
             idx += 1
-    # super nodes: we'll add two more for s* and t* and later two more for main S and T
-    S_star = idx; idx += 1
-    T_star = idx; idx += 1
-    S_main = idx; idx += 1
-    T_main = idx; idx += 1
-
-    N = idx
-    dinic = Dinic(N)
-
-    # We'll store mapping from original edges to the forward edge object (node, pos)
-    edge_records = []  # tuples: (u_name, v_name, lo, hi, (u_idx, pos_in_g[u_idx]))
-
-    # Step 1: Add node-split cap edges
-    node_split_edge_ref = {}  # name -> (u, pos)
-    for name in sorted_nodes:
-        if in_id[name] != out_id[name]:
-            cap = float(node_caps.get(name, 0.0))
-            u, pos = dinic.add_edge(in_id[name], out_id[name], cap)
-            node_split_edge_ref[name] = (u, pos)
 
     # Step 2: Add edges with capacity hi - lo, record lo demands
-    demand = [0.0] * N  # imbalance caused by lower bounds (on the node indices we chose: use in/out mapping)
-
-    for e in sorted(edges_in, key=lambda x: (x['from'], x['to'])):
+    # We'll store mapping from original edges to the index of their forward edge,
+    # as parallel columns: from name, to name, lower bound, forward edge index
+    ids = nm.map
+    rec_from = []; rec_to = []; u_ids = []; v_ids = []; rec_lo = []; rec_hi = []
+    for e in edges_sorted:
         u_name = e['from']; v_name = e['to']
         lo = float(e.get('lo', 0.0)); hi = float(e.get('hi', 0.0))
-        if hi + EPS < lo:
+        if hi + eps < lo:
             # invalid bounds -> infeasible immediately
             return {'status':'infeasible', 'cut_reachable': [], 'deficit': {'demand_balance': lo-hi, 'tight_nodes': [], 'tight_edges': []}}
-        cap = max(0.0, hi - lo)
-        u_idx = out_id[u_name]
-        v_idx = in_id[v_name]
-        u_pos, u_edge_pos = dinic.add_edge(u_idx, v_idx, cap)
-        # record forward edge position for later reconstruction: it's at g[u_idx][u_edge_pos]
-        edge_records.append((u_name, v_name, lo, hi, (u_idx, u_edge_pos)))
-        # accumulate demands
-        demand[v_idx] += lo
-        demand[u_idx] -= lo
+        rec_from.append(u_name); rec_to.append(v_name)
+        u_ids.append(ids[u_name]); v_ids.append(ids[v_name])
+        rec_lo.append(lo); rec_hi.append(hi)
+    lo_arr = np.array(rec_lo, np.float64)
+    u_idx = out_id[u_ids]
+    v_idx = in_id[v_ids]
+    caps = np.maximum(0.0, np.array(rec_hi, np.float64) - lo_arr)
+    rec_idx = [dinic.add_edge(u, v, c) for u, v, c in zip(u_idx.tolist(), v_idx.tolist(), caps.tolist())]
+    edge_records = (rec_from, rec_to, lo_arr, np.array(rec_idx, np.int32))
+
+    # With every lower bound zero there are no node demands, so the S* -> T*
+    # circulation check below is trivially satisfied and is skipped entirely.
+    has_lower_bounds = bool(np.any(lo_arr != 0.0))
 
     # Step 3: connect node demands to S* and T*
     total_pos_demand = 0.0
-    for i in range(N):
-        if abs(demand[i]) <= EPS: continue
-        if demand[i] > 0:
-            dinic.add_edge(S_star, i, demand[i])
-            total_pos_demand += demand[i]
-        else:
-            dinic.add_edge(i, T_star, -demand[i])
+    if has_lower_bounds:
+        # accumulate demands (imbalance caused by lower bounds on the node indices we chose),
+        # edge by edge: +lo at the head, -lo at the tail
+        demand = np.zeros(N, np.float64)
+        np.add.at(demand, np.stack([v_idx, u_idx], axis=1).ravel(), np.stack([lo_arr, -lo_arr], axis=1).ravel())
+        for i in np.flatnonzero(np.abs(demand) > eps).tolist():
+            d = float(demand[i])
+            if d > 0:
+                dinic.add_edge(S_star, i, d)
+                total_pos_demand += d
+            else:
+                dinic.add_edge(i, T_star, -d)
 
-    # Now run maxflow from S* to T* to check lower-bound feasibility (circulation)
-    flowed = dinic.max_flow(S_star, T_star)
-    if abs(flowed - total_pos_demand) > 1e-6:
-        # infeasible lower bounds -> produce certificate derived from min-cut of S* -> T*
-        # find reachable from S* in residual graph
-        visited = [False]*N
-        q = deque([S_star]); visited[S_star] = True
-        while q:
-            u = q.popleft()
-            for e in dinic.g[u]:
-                if e.cap > EPS and not visited[e.to]:
-                    visited[e.to] = True; q.append(e.to)
-        # build cut_reachable using original node names (map in_id/out_id to names)
-        reachable_names = set()
-        for name in sorted_nodes:
-            if visited[in_id[name]] or visited[out_id[name]]:
-                reachable_names.add(name)
-        # tight edges crossing cut: edges from reachable to unreachable that are saturated (i.e., remaining cap <= EPS)
-        tight_edges = []
-        for (u_name, v_name, lo, hi, (u_idx, pos)) in edge_records:
-            e = dinic.g[u_idx][pos]
-            # original capacity of reduced edge = hi-lo
-            orig_cap = e.orig
-            # if u in reachable and v not
-            if (visited[u_idx] and not visited[dinic.g[u_idx][pos].to]):
-                # remaining cap e.cap; if saturated
-                if e.cap <= EPS:
-                    tight_edges.append({'from': u_name, 'to': v_name, 'flow_needed': lo + orig_cap})
-        # tight nodes: node-split edges saturated
-        tight_nodes = []
-        for name, (u,pos) in node_split_edge_ref.items():
-            e = dinic.g[u][pos]
-            if e.cap <= EPS:
-                tight_nodes.append(name)
-        deficit = {
-            'demand_balance': round((total_pos_demand - flowed), 9),
-            'tight_nodes': sorted(tight_nodes),
-            'tight_edges': tight_edges
-        }
-        return {'status':'infeasible', 'cut_reachable': sorted(list(reachable_names)), 'deficit': deficit}
-
-    # Lower bounds feasible. Now remove S* and T* edges from consideration and prepare main flow.
-    # We'll keep the current residual capacities (dinic.g contains updated caps after circulation flow).
-    # Next, we want to send supplies from sources to sink. Create edges from S_main to each source node (their out id),
+    # Step 4: send supplies from sources to sink. Create edges from S_main to each source node (their out id),
     # and from sink node (its in id) to T_main with capacity = total supply.
-
+    # These are added before any flow runs so the graph is complete up front; S_main has no incoming
+    # residual capacity and T_main no outgoing one, so they cannot carry circulation flow.
     total_supply = 0.0
     for sname in sorted(sources.keys()):
         supply = float(sources[sname])
-        if supply < -EPS: supply = 0.0
-        if sname not in out_id:
+        if supply < -eps: supply = 0.0
+        if sname not in ids:
             # source not in node set => infeasible
             return {'status':'infeasible','cut_reachable': [], 'deficit': {'demand_balance': supply, 'tight_nodes': [], 'tight_edges': []}}
         if supply > 0:
-            dinic.add_edge(S_main, out_id[sname], supply)
+            dinic.add_edge(S_main, int(out_id[ids[sname]]), supply)
             total_supply += supply
-    if sink is None or sink not in in_id:
+    sink_ok = sink is not None and sink in ids
+    if sink_ok:
+        # connect sink to T_main with capacity total_supply
+        dinic.add_edge(int(in_id[ids[sink]]), T_main, total_supply)
+
+    dinic.build_csr()
+    u_names, v_names, lo_arr, edge_idx = edge_records
+    edge_records = (u_names, v_names, lo_arr, dinic.pos[edge_idx])
+    node_split_edge_ref = {name: int(dinic.pos[e]) for name, e in node_split_edge_ref.items()}
+
+    # Now run maxflow from S* to T* to check lower-bound feasibility (circulation)
+    if has_lower_bounds:
+        flowed = dinic.max_flow(S_star, T_star)
+        if abs(flowed - total_pos_demand) > tol:
+            # infeasible lower bounds -> produce certificate derived from min-cut of S* -> T*
+            visited = dinic.level >= 0
+            return _cut_certificate(dinic, visited, sorted_nodes, in_id, out_id, edge_records, node_split_edge_ref,
+                                    total_pos_demand - flowed)
+
+    # Lower bounds feasible. The S* and T* edges stay in the graph with their residual capacities.
+    if not sink_ok:
         # invalid sink
         return {'status':'infeasible','cut_reachable': [], 'deficit': {'demand_balance': total_supply, 'tight_nodes': [], 'tight_edges': []}}
-    # connect sink to T_main with capacity total_supply
-    dinic.add_edge(in_id[sink], T_main, total_supply)
 
     # Run max flow from S_main to T_main
     pushed = dinic.max_flow(S_main, T_main)
-    if abs(pushed - total_supply) > 1e-6:
+    if abs(pushed - total_supply) > tol:
         # infeasible to send all supply to sink -> produce cut certificate from S_main
-        visited = [False]*N
-        q = deque([S_main]); visited[S_main]=True
-        while q:
-            u=q.popleft()
-            for e in dinic.g[u]:
-                if e.cap > EPS and not visited[e.to]:
-                    visited[e.to]=True; q.append(e.to)
-        reachable_names = set()
-        for name in sorted_nodes:
-            if visited[in_id[name]] or visited[out_id[name]]:
-                reachable_names.add(name)
         # demand_balance is unsent supply on source side: total_supply - pushed
-        tight_edges = []
-        for (u_name, v_name, lo, hi, (u_idx, pos)) in edge_records:
-            e = dinic.g[u_idx][pos]
-            if (visited[u_idx] and not visited[dinic.g[u_idx][pos].to]):
-                if e.cap <= EPS:
-                    orig_cap = e.orig
-                    tight_edges.append({'from': u_name, 'to': v_name, 'flow_needed': lo + orig_cap})
-        tight_nodes = []
-        for name, (u,pos) in node_split_edge_ref.items():
-            e = dinic.g[u][pos]
-            if e.cap <= EPS:
-                tight_nodes.append(name)
-        deficit = {
-            'demand_balance': round((total_supply - pushed), 9),
-            'tight_nodes': sorted(tight_nodes),
-            'tight_edges': tight_edges
-        }
-        return {'status':'infeasible', 'cut_reachable': sorted(list(reachable_names)), 'deficit': deficit}
+        visited = dinic.level >= 0
+        return _cut_certificate(dinic, visited, sorted_nodes, in_id, out_id, edge_records, node_split_edge_ref,
+                                total_supply - pushed)
 
     # Success: reconstruct flows for original edges: flow = (orig_cap - current_cap) + lo
-    flows = []
-    for (u_name, v_name, lo, hi, (u_idx, pos)) in edge_records:
-        e = dinic.g[u_idx][pos]
-        used = e.orig - e.cap
-        final_flow = used + lo
-        # clamp small negatives
-        if abs(final_flow) < 1e-12: final_flow = 0.0
-        flows.append({'from': u_name, 'to': v_name, 'flow': round(final_flow, 9)})
+    u_names, v_names, lo_arr, edge_idx = edge_records
+    final = (dinic.orig[edge_idx] - dinic.cap[edge_idx]) + lo_arr
+    # clamp small negatives
+    final[np.abs(final) < 1e-12] = 0.0
+    flows = [{'from': u, 'to': v, 'flow': round(f, 9)} for u, v, f in zip(u_names, v_names, final.tolist())]
 
     # compute total delivered to sink
-    total_delivered = 0.0
-    for f in flows:
-        if f['to'] == sink:
-            total_delivered += f['flow']
+    total_delivered = sum((f['flow'] for f in flows if f['to'] == sink), 0.0)
 
     return {'status':'ok', 'max_flow_per_min': round(total_delivered, 9), 'flows': flows}
 
 
+def _cut_certificate(dinic, visited, sorted_nodes, in_id, out_id, edge_records, node_split_edge_ref, balance):
+    # build cut_reachable using original node names (map in_id/out_id to names; sorted_nodes is sorted)
+    reachable = visited[in_id] | visited[out_id]
+    reachable_names = [name for name, r in zip(sorted_nodes, reachable.tolist()) if r]
+    # tight edges crossing cut: edges from reachable to unreachable that are saturated (i.e., remaining cap <= eps)
+    u_names, v_names, lo_arr, edge_idx = edge_records
+    tight_mask = visited[dinic.to[dinic.rev[edge_idx]]] & ~visited[dinic.to[edge_idx]] & (dinic.cap[edge_idx] <= dinic.eps)
+    # original capacity of reduced edge = hi-lo
+    needed = (lo_arr + dinic.orig[edge_idx]).tolist()
+    tight_edges = [{'from': u_names[k], 'to': v_names[k], 'flow_needed': needed[k]} for k in np.flatnonzero(tight_mask)]
+    # tight nodes: node-split edges saturated
+    split_idx = np.fromiter(node_split_edge_ref.values(), np.int32, len(node_split_edge_ref))
+    tight_nodes = [name for name, sat in zip(node_split_edge_ref, dinic.cap[split_idx] <= dinic.eps) if sat]
+    deficit = {
+        'demand_balance': round(float(balance), 9),
+        'tight_nodes': sorted(tight_nodes),
+        'tight_edges': tight_edges
+    }
+    return {'status':'infeasible', 'cut_reachable': reachable_names, 'deficit': deficit}
+
+
+def solve_many(inputs):
+    # solve independent belt inputs in a process pool, so a batch pays the
+    # interpreter and import start-up once per worker rather than per input
+    with ProcessPoolExecutor() as ex:
+        return list(ex.map(solve_belts, inputs))
+
+
+def _warm_up():
+    # Run both capacity types once on a two-node graph before the input is
+    # read, so the kernels are loaded from numba's on-disk cache (or compiled
+    # into it on a first run) while the caller is still writing stdin.
+    for integral in (True, False):
+        dinic = Dinic(2, 2, integral)
+        dinic.add_edge(0, 1, 1)
+        dinic.build_csr()
+        dinic.max_flow(0, 1)
+
+
 if __name__ == '__main__':
+    _warm_up()
     inp = read_input()
     try:
         out = solve_belts(inp)
@@ -1,9 +1,59 @@
 import sys, json
 import numpy as np
-from scipy.optimize import linprog
+import scipy.sparse as sp
+import highspy
+
+# output goes to sys.stdout.buffer as bytes, so it does not depend on the
+# console encoding (UTF-8 from orjson, ASCII-escaped from json)
+try:
+    import orjson
+
+    def _loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. NaN / Infinity, which json.load accepts
+            return json.loads(data)
+
+    _dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+    _dumps = lambda obj: json.dumps(obj, indent=2).encode()
+
+
+def solve_lp(c, A_ub, b_ub, A_eq, b_eq):
+    """Minimise c @ x subject to A_ub @ x <= b_ub, A_eq @ x == b_eq, x >= 0.
+
+    Calls HiGHS directly with a column-wise sparse matrix; returns the optimal
+    x, or None if the LP has no optimal solution.
+    """
+    A = sp.vstack([A_eq, A_ub], format="csc")
+    num_row, num_col = A.shape
+    inf = highspy.kHighsInf
+
+    lp = highspy.HighsLp()
+    lp.num_col_ = num_col
+    lp.num_row_ = num_row
+    lp.col_cost_ = np.asarray(c, dtype=float)
+    lp.col_lower_ = np.zeros(num_col)
+    lp.col_upper_ = np.full(num_col, inf)
+    lp.row_lower_ = np.concatenate([b_eq, np.full(len(b_ub), -inf)])
+    lp.row_upper_ = np.concatenate([b_eq, b_ub]).astype(float)
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+    lp.a_matrix_.start_ = A.indptr
+    lp.a_matrix_.index_ = A.indices
+    lp.a_matrix_.value_ = A.data
+
+    h = highspy.Highs()
+    h.setOptionValue("output_flag", False)
+    h.passModel(lp)
+    h.run()
+    if h.getModelStatus() != highspy.HighsModelStatus.kOptimal:
+        return None
+    return np.array(h.getSolution().col_value)
 
 def main():
-    data = json.load(sys.stdin)
+    data = _loads(sys.stdin.buffer.read())
 
     machines = data["machines"]
     recipes = data["recipes"]
@@ -30,114 +80,71 @@ def main():
     I = len(item_list)
     item_index = {it: i for i, it in enumerate(item_list)}
 
-    # Build A matrix and b vector for conservation
-    A = np.zeros((I, R))
-
-    for j, rname in enumerate(recipe_names):
-        r = recipes[rname]
-        mtype = r["machine"]
-        base_speed = machines[mtype]["crafts_per_min"]
-        speed_mod = modules.get(mtype, {}).get("speed", 0)
-        prod_mod = modules.get(mtype, {}).get("prod", 0)
-
-        time_s = r["time_s"]
-        eff_crafts_per_min = base_speed * (1 + speed_mod) * 60 / time_s
-
-        # Each craft: inflows negative, outflows positive (with productivity)
-        for itm, amt in r.get("in", {}).items():
-            A[item_index[itm], j] -= amt
-        for itm, amt in r.get("out", {}).items():
-            A[item_index[itm], j] += amt * (1 + prod_mod)
-
-    b = np.zeros(I)
-    for i, itm in enumerate(item_list):
-        if itm == target_item:
-            b[i] = target_rate
-        elif itm in raw_caps:
-            b[i] = 0  # we will constrain separately
-        else:
-            b[i] = 0
-
-    # For raw materials: consumption <= cap
-    # => -sum_r A[i,r]*x_r <= cap (since A[i,r] is -ve for input)
-
     # Machine usage constraints
     M = len(machine_caps)
     machine_types = sorted(machine_caps.keys())
     machine_index = {m: i for i, m in enumerate(machine_types)}
 
-    usage_matrix = np.zeros((M, R))
-    for j, rname in enumerate(recipe_names):
-        r = recipes[rname]
-        mtype = r["machine"]
-        base_speed = machines[mtype]["crafts_per_min"]
-        speed_mod = modules.get(mtype, {}).get("speed", 0)
-        time_s = r["time_s"]
-        eff_crafts_per_min = base_speed * (1 + speed_mod) * 60 / time_s
-        usage_matrix[machine_index[mtype], j] = 1 / eff_crafts_per_min
+    # Per-recipe machine parameters, so the effective rate is computed once
+    recipe_machine = [recipes[rname]["machine"] for rname in recipe_names]
+    base_speed = np.array([machines[m]["crafts_per_min"] for m in recipe_machine], dtype=float)
+    speed_mod = np.array([modules.get(m, {}).get("speed", 0) for m in recipe_machine], dtype=float)
+    prod_mod = np.array([modules.get(m, {}).get("prod", 0) for m in recipe_machine], dtype=float)
+    time_s = np.array([recipes[rname]["time_s"] for rname in recipe_names], dtype=float)
+    eff_crafts_per_min = base_speed * (1 + speed_mod) * 60 / time_s
 
     # Build LP
     # Objective: minimize total machines used
-    c = np.zeros(R)
+    c = 1 / eff_crafts_per_min
+
+    # Build A matrix for conservation (as sparse triplets) in one pass
+    rows, cols, vals = [], [], []
+
     for j, rname in enumerate(recipe_names):
         r = recipes[rname]
-        mtype = r["machine"]
-        base_speed = machines[mtype]["crafts_per_min"]
-        speed_mod = modules.get(mtype, {}).get("speed", 0)
-        time_s = r["time_s"]
-        eff_crafts_per_min = base_speed * (1 + speed_mod) * 60 / time_s
-        c[j] = 1 / eff_crafts_per_min
 
-    A_eq = []
-    b_eq = []
+        # Each craft: inflows negative, outflows positive (with productivity)
+        for itm, amt in r.get("in", {}).items():
+            rows.append(item_index[itm]); cols.append(j); vals.append(-amt)
+        out_scale = 1 + prod_mod[j]
+        for itm, amt in r.get("out", {}).items():
+            rows.append(item_index[itm]); cols.append(j); vals.append(amt * out_scale)
 
-    for i, itm in enumerate(item_list):
-        if itm == target_item or itm not in raw_caps:
-            A_eq.append(A[i, :])
-            b_eq.append(b[i])
+    # duplicate (item, recipe) entries are summed; rows are sliced below, hence CSR
+    A = sp.coo_matrix((np.array(vals, dtype=float), (rows, cols)), shape=(I, R)).tocsr()
 
-    A_eq = np.array(A_eq)
-    b_eq = np.array(b_eq)
+    # Machine usage: recipe j occupies c[j] machines of its type per craft/min
+    usage_rows = [machine_index[m] for m in recipe_machine]
+    usage_matrix = sp.csr_matrix((c, (usage_rows, np.arange(R))), shape=(M, R))
 
-    A_ub = []
-    b_ub = []
+    b = np.zeros(I)
+    b[item_index[target_item]] = target_rate
 
-    # raw caps
-    for itm, cap in raw_caps.items():
-        i = item_index[itm]
-        A_ub.append(-A[i, :])
-        b_ub.append(cap)
+    # Conservation rows: the target and every non-raw item
+    is_eq = np.array([itm == target_item or itm not in raw_caps for itm in item_list], dtype=bool)
+    A_eq = A[is_eq]
+    b_eq = b[is_eq]
 
-    # machine caps
-    for mtype, cap in machine_caps.items():
-        A_ub.append(usage_matrix[machine_index[mtype], :])
-        b_ub.append(cap)
+    # For raw materials: consumption <= cap
+    # => -sum_r A[i,r]*x_r <= cap (since A[i,r] is -ve for input)
+    raw_idx = np.array([item_index[itm] for itm in raw_caps], dtype=int)
+    machine_idx = np.array([machine_index[mtype] for mtype in machine_caps], dtype=int)
 
-    A_ub = np.array(A_ub)
-    b_ub = np.array(b_ub)
+    A_ub = sp.vstack([-A[raw_idx], usage_matrix[machine_idx]])
+    b_ub = np.array(list(raw_caps.values()) + list(machine_caps.values()), dtype=float)
 
-    res = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=(0, None), method="highs")
+    x = solve_lp(c, A_ub, b_ub, A_eq, b_eq)
 
-    if res.success:
-        x = res.x
+    if x is not None:
         per_recipe = {r: float(x[j]) for j, r in enumerate(recipe_names)}
 
         # Compute per-machine counts
         per_machine = {m: 0.0 for m in machine_caps.keys()}
-        for j, rname in enumerate(recipe_names):
-            r = recipes[rname]
-            mtype = r["machine"]
-            base_speed = machines[mtype]["crafts_per_min"]
-            speed_mod = modules.get(mtype, {}).get("speed", 0)
-            time_s = r["time_s"]
-            eff_crafts_per_min = base_speed * (1 + speed_mod) * 60 / time_s
-            per_machine[mtype] += x[j] / eff_crafts_per_min
-
-        raw_use = {}
-        for itm, cap in raw_caps.items():
-            i = item_index[itm]
-            cons = -A[i, :] @ x
-            raw_use[itm] = float(cons)
+        for j, mtype in enumerate(recipe_machine):
+            per_machine[mtype] += x[j] / eff_crafts_per_min[j]
+
+        raw_cons = -(A[raw_idx] @ x)
+        raw_use = {itm: float(cons) for itm, cons in zip(raw_caps, raw_cons)}
 
         out = {
             "status": "ok",
@@ -152,7 +159,7 @@ def main():
             "bottleneck_hint": ["machine or raw limit"]
         }
 
-    json.dump(out, sys.stdout, indent=2)
+    sys.stdout.buffer.write(_dumps(out))
 
 if __name__ == "__main__":
     main()
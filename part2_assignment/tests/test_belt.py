@@ -33,3 +33,106 @@ def test_sample_case():
     total_out = sum(f for e, f in flow.items() if e.startswith("S->"))
     assert abs(total_out - 10) < 1e-6, f"Expected 10 flow out of S, got {total_out}"
     print("Sample case passed. Result:", json.dumps(result, indent=2))
+
+def test_solve_many_matches_cli(monkeypatch):
+    monkeypatch.syspath_prepend(os.path.join(os.path.dirname(__file__), '..'))
+    from belts.main import solve_many
+
+    inputs = [
+        {
+            "edges": [{"from": "S", "to": "T", "lo": 0, "hi": 5}],
+            "sources": {"S": 4},
+            "sink": "T",
+        },
+        {
+            "edges": [{"from": "S", "to": "T", "lo": 0, "hi": 5}],
+            "sources": {"S": 9},
+            "sink": "T",
+        },
+    ]
+    results = solve_many(inputs)
+    assert results == [run_belts(inp) for inp in inputs]
+    assert results[0]["status"] == "ok"
+    assert results[1]["status"] == "infeasible"
+
+def test_integer_and_float_rates_agree():
+    # integer inputs take the exact int64 path, float inputs the EPS path
+    int_input = {
+        "edges": [
+            {"from": "S", "to": "A", "lo": 0, "hi": 10},
+            {"from": "A", "to": "T", "lo": 0, "hi": 6},
+            {"from": "A", "to": "B", "lo": 0, "hi": 4},
+            {"from": "B", "to": "T", "lo": 0, "hi": 4},
+        ],
+        "sources": {"S": 9},
+        "sink": "T",
+        "node_caps": {"A": 9},
+    }
+    float_input = json.loads(json.dumps(int_input))
+    for e in float_input["edges"]:
+        e["lo"] = float(e["lo"]); e["hi"] = float(e["hi"])
+    float_input["sources"]["S"] = 9.0
+
+    result = run_belts(int_input)
+    assert result["status"] == "ok"
+    assert result["max_flow_per_min"] == 9.0
+    assert result == run_belts(float_input)
+
+def _as_floats(inp):
+    out = json.loads(json.dumps(inp))
+    for e in out["edges"]:
+        e["lo"] = float(e["lo"]); e["hi"] = float(e["hi"])
+    out["sources"] = {k: float(v) for k, v in out["sources"].items()}
+    out["node_caps"] = {k: float(v) for k, v in out.get("node_caps", {}).items()}
+    return out
+
+def test_integer_and_float_rates_agree_with_lower_bounds():
+    # lower bounds, the circulation check and the cut certificate are where
+    # the int64 path (eps == 0) and the float path (EPS) could differ
+    loop = [
+        {"from": "S", "to": "A", "lo": 2, "hi": 10},
+        {"from": "A", "to": "T", "lo": 3, "hi": 8},
+        {"from": "T", "to": "S", "lo": 0, "hi": 5},
+    ]
+    cases = [
+        # feasible with lower bounds
+        ({"edges": loop + [{"from": "A", "to": "B", "lo": 1, "hi": 4},
+                           {"from": "B", "to": "T", "lo": 0, "hi": 4}],
+          "sources": {"S": 6}, "sink": "T", "node_caps": {"A": 12}}, "ok"),
+        # node cap below the lower bounds: circulation check fails
+        ({"edges": loop, "sources": {"S": 4}, "sink": "T", "node_caps": {"A": 2}}, "infeasible"),
+        # supply exceeds the cut: tight edges in the certificate
+        ({"edges": [{"from": "S", "to": "A", "lo": 1, "hi": 10},
+                    {"from": "A", "to": "T", "lo": 0, "hi": 3},
+                    {"from": "A", "to": "B", "lo": 0, "hi": 4},
+                    {"from": "B", "to": "T", "lo": 0, "hi": 4}],
+          "sources": {"S": 9}, "sink": "T"}, "infeasible"),
+        # hi below lo
+        ({"edges": [{"from": "S", "to": "T", "lo": 5, "hi": 3}], "sources": {"S": 1}, "sink": "T"}, "infeasible"),
+    ]
+    for inp, status in cases:
+        result = run_belts(inp)
+        assert result["status"] == status
+        assert result == run_belts(_as_floats(inp))
+
+def test_large_integer_rates():
+    # rates beyond what int64 / float64 hold exactly fall back to the float path
+    big = {
+        "edges": [{"from": "S", "to": "T", "lo": 0, "hi": 2**70}],
+        "sources": {"S": 2**70},
+        "sink": "T",
+    }
+    result = run_belts(big)
+    assert result["status"] == "ok"
+    assert result["max_flow_per_min"] == float(2**70)
+
+    two = {
+        "edges": [{"from": "A", "to": "T", "lo": 0, "hi": 2**62},
+                  {"from": "B", "to": "T", "lo": 0, "hi": 2**62}],
+        "sources": {"A": 2**62, "B": 2**62},
+        "sink": "T",
+    }
+    result = run_belts(two)
+    assert result["status"] == "ok"
+    assert result["max_flow_per_min"] == float(2**63)
+    assert result == run_belts(_as_floats(two))